@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark serial vs multi-process parse_tickets on a synthetic ticket corpus.
+"""
+
+import argparse
+import json
+import random
+import time
+
+from parse_tickets import CATEGORIES, ProductIndex, available_cpus, parse_tickets
+
+STORES = ["GALAPAGAR", "POZUELO", "TORRELODONES", "C/ LOS VASCOS MADRID"]
+
+
+def generate_corpus(n_tickets, seed=1, duplicate_ratio=0.05):
+    """Build a tickets_mercadona.txt-like text with n_tickets tickets.
+
+    About duplicate_ratio of the tickets reuse an earlier invoice id, so the
+    first-occurrence-wins dedup is exercised across chunk boundaries.
+    """
+    rng = random.Random(seed)
+    names = [keyword + suffix
+             for cat in CATEGORIES.values()
+             for keyword in cat["keywords"]
+             for suffix in ("", " HACENDADO", " 1,5L", " 6X")]
+    invoice_ids = []
+    blocks = []
+    for n in range(n_tickets):
+        if invoice_ids and rng.random() < duplicate_ratio:
+            invoice_id = rng.choice(invoice_ids)
+        else:
+            invoice_id = f"{rng.randint(1000, 1100)}-{rng.randint(1, 30)}-{n}"
+            invoice_ids.append(invoice_id)
+        date = f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(2022, 2025)}"
+        lines = [
+            "MERCADONA, S.A. A-46103834",
+            rng.choice(STORES),
+            f"{date} {rng.randint(9, 21):02d}:{rng.randint(0, 59):02d}",
+            f"FACTURA SIMPLIFICADA: {invoice_id}",
+            "Descripción P. Unit Importe",
+        ]
+        for _ in range(rng.randint(5, 30)):
+            qty = rng.randint(1, 3)
+            price = rng.randint(50, 900) / 100
+            name = rng.choice(names)
+            if qty == 1:
+                line = f"1 {name} {price:.2f}"
+            else:
+                line = f"{qty} {name} {price:.2f} {price * qty:.2f}"
+            lines.append(line.replace(".", ","))
+        lines.append(f"TOTAL (€) {rng.randint(5, 200)},00")
+        blocks.append(f"📄 ticket_{n}.pdf\n{'=' * 40}\n" + "\n".join(lines) + f"\n{'=' * 40}")
+    return "\n".join(blocks)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip())
+    arg_parser.add_argument('-n', '--tickets', type=int, default=20000,
+                            help='Number of synthetic tickets (default: 20000)')
+    arg_parser.add_argument('-j', '--workers', type=int, nargs='+', default=[2, 4, 8],
+                            help='Worker counts to compare against the serial run (default: 2 4 8)')
+    arg_parser.add_argument('-r', '--repeat', type=int, default=3,
+                            help='Runs per configuration, best time is reported (default: 3)')
+    args = arg_parser.parse_args()
+
+    text = generate_corpus(args.tickets)
+    cpus = available_cpus()
+    print(f"CPUs: {cpus}  tickets: {args.tickets}  corpus: {len(text) / 1e6:.1f} MB")
+    if max(args.workers) > cpus:
+        print(f"  (parse_tickets caps workers at {cpus}: higher counts measure the capped run)")
+
+    reference = None
+    serial_time = None
+    for workers in [1] + args.workers:
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            tickets = parse_tickets(text, ProductIndex(), workers=workers)
+            best = min(best, time.perf_counter() - start)
+        output = json.dumps(tickets, ensure_ascii=False)
+        if reference is None:
+            reference, serial_time = output, best
+        speedup = serial_time / best
+        identical = "yes" if output == reference else "NO"
+        print(f"  workers={workers:<3} {best:7.2f}s  speedup x{speedup:4.2f}  "
+              f"tickets={len(tickets)}  identical={identical}")
+
+
+if __name__ == '__main__':
+    main()
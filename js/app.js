@@ -396,6 +396,15 @@ function getFilteredTickets() {
   });
 }
 
+// Price data precomputed by parse_tickets.py, only valid for the unfiltered view of the same tickets
+function getPrecomputedPriceChanges() {
+  const precomputed = fullData?.priceChanges;
+  if (!precomputed?.monthly) return null;
+  if (currentYear !== 'all' || currentStore !== 'all') return null;
+  if (precomputed.ticketCount !== ticketsData.length) return null;
+  return precomputed;
+}
+
 // Tab management
 function setupTabs() {
   const tabs = document.querySelectorAll('.tab-btn');
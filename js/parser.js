@@ -730,8 +730,9 @@ async function processPDFs(files, progressCallback) {
 
 /**
  * Build the complete data structure from tickets
+ * precomputed: sections generated by parse_tickets.py (priceChanges, productAliases)
  */
-function buildTicketsData(tickets, mapping = {}) {
+function buildTicketsData(tickets, mapping = {}, precomputed = {}) {
   const categories = {};
   for (const [key, value] of Object.entries(CATEGORIES_CONFIG)) {
     categories[key] = {
@@ -750,6 +751,7 @@ function buildTicketsData(tickets, mapping = {}) {
     },
     categories: categories,
     productMapping: mapping,
+    ...precomputed,
     tickets: tickets
   };
 }
@@ -774,6 +776,12 @@ function migrateTicketsData(data) {
   // Preserve existing mapping if available
   const existingMapping = data.productMapping || {};
 
+  // Preserve sections precomputed by parse_tickets.py (prices don't change on migration;
+  // readers check priceChanges.ticketCount before trusting them)
+  const precomputed = {};
+  if (data.priceChanges) precomputed.priceChanges = data.priceChanges;
+  if (data.productAliases) precomputed.productAliases = data.productAliases;
+
   // Try to re-parse from raw texts first (full re-parse)
   const rawTexts = getRawTexts();
   if (Object.keys(rawTexts).length > 0) {
@@ -782,7 +790,7 @@ function migrateTicketsData(data) {
 
     if (reparsedTickets && reparsedTickets.length > 0) {
       // Pass existing mapping to buildTicketsData so we don't lose it
-      const migratedData = buildTicketsData(reparsedTickets, existingMapping);
+      const migratedData = buildTicketsData(reparsedTickets, existingMapping, precomputed);
       console.log(`Full re-parse complete: ${reparsedTickets.length} tickets updated to parser v${PARSER_VERSION}`);
       return { data: migratedData, migrated: true };
     }
@@ -800,7 +808,7 @@ function migrateTicketsData(data) {
   }
 
   // Rebuild data structure with updated version
-  const migratedData = buildTicketsData(tickets, existingMapping);
+  const migratedData = buildTicketsData(tickets, existingMapping, precomputed);
 
   console.log(`Migration complete: ${tickets.length} tickets updated to parser v${PARSER_VERSION}`);
 
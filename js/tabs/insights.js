@@ -14,18 +14,26 @@ function renderPriceAlerts(tickets) {
   const container = document.getElementById('priceAlertsList');
   if (!container) return;
   
-  // Logic to find price changes
+  // Logic to find price changes (monthly averages precomputed by parse_tickets.py when valid)
+  const precomputed = getPrecomputedPriceChanges();
   const priceData = {};
-  tickets.forEach(t => {
-    const month = t.date.substring(0, 7);
-    (t.items || []).forEach(item => {
-      const price = item.unitPrice || item.price;
-      if (!price) return;
-      if (!priceData[item.name]) priceData[item.name] = {};
-      if (!priceData[item.name][month]) priceData[item.name][month] = [];
-      priceData[item.name][month].push(price);
+  if (precomputed) {
+    Object.entries(precomputed.monthly).forEach(([name, months]) => {
+      priceData[name] = {};
+      Object.entries(months).forEach(([month, avg]) => { priceData[name][month] = [avg]; });
     });
-  });
+  } else {
+    tickets.forEach(t => {
+      const month = t.date.substring(0, 7);
+      (t.items || []).forEach(item => {
+        const price = item.unitPrice || item.price;
+        if (!price) return;
+        if (!priceData[item.name]) priceData[item.name] = {};
+        if (!priceData[item.name][month]) priceData[item.name][month] = [];
+        priceData[item.name][month].push(price);
+      });
+    });
+  }
   
   const alerts = [];
   Object.entries(priceData).forEach(([name, history]) => {
@@ -9,28 +9,11 @@ let comparisonList = [];
 
 
 function renderPriceHistory() {
-  const tickets = getFilteredTickets();
-
-  // Collect price data
-  const priceData = {};
-  tickets.forEach(t => {
-    const date = t.date.substring(0, 7); // YYYY-MM
-    if (!t.items) return;
-    t.items.forEach(item => {
-      const price = item.unitPrice || item.price;
-      if (!price) return;
-      const name = getNormalizedName(item.name);
-      if (!priceData[name]) {
-        priceData[name] = { prices: [], dates: [], history: {} };
-      }
-      priceData[name].prices.push(price);
-      priceData[name].dates.push(t.date);
-      if (!priceData[name].history[date]) {
-        priceData[name].history[date] = [];
-      }
-      priceData[name].history[date].push(price);
-    });
-  });
+  // Precomputed monthly averages group by parser name, so skip them when manual groups exist
+  const precomputed = Object.keys(productMapping).length === 0 ? getPrecomputedPriceChanges() : null;
+  const priceData = precomputed
+    ? priceDataFromMonthly(precomputed.monthly)
+    : collectPriceData(getFilteredTickets());
 
   // Calculate variations
   const variations = Object.entries(priceData).map(([name, data]) => {
@@ -63,6 +46,46 @@ function renderPriceHistory() {
   renderPriceTable(variations);
 }
 
+function collectPriceData(tickets) {
+  const priceData = {};
+  tickets.forEach(t => {
+    const date = t.date.substring(0, 7); // YYYY-MM
+    if (!t.items) return;
+    t.items.forEach(item => {
+      const price = item.unitPrice || item.price;
+      if (!price) return;
+      const name = getNormalizedName(item.name);
+      if (!priceData[name]) {
+        priceData[name] = { prices: [], dates: [], history: {} };
+      }
+      priceData[name].prices.push(price);
+      priceData[name].dates.push(t.date);
+      if (!priceData[name].history[date]) {
+        priceData[name].history[date] = [];
+      }
+      priceData[name].history[date].push(price);
+    });
+  });
+
+  return priceData;
+}
+
+// Same shape as collectPriceData, one averaged price per month
+function priceDataFromMonthly(monthly) {
+  const priceData = {};
+  Object.entries(monthly).forEach(([name, months]) => {
+    const sorted = Object.keys(months).sort();
+    const history = {};
+    sorted.forEach(m => { history[m] = [months[m]]; });
+    priceData[name] = {
+      prices: sorted.map(m => months[m]),
+      dates: sorted.map(m => `${m}-01`),
+      history
+    };
+  });
+  return priceData;
+}
+
 function renderPriceSummary(variations) {
   const container = document.getElementById('priceSummaryCards');
   if (!container) return;
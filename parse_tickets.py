@@ -3,9 +3,15 @@
 Parse tickets_mercadona.txt and generate complete tickets.json
 """
 
+import argparse
 import re
 import json
+import math
+import os
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 # Parser version - must match js/parser.js PARSER_VERSION
 PARSER_VERSION = '2.0.0'
@@ -235,13 +241,17 @@ CATEGORIES = {
     }
 }
 
+# Reglas precompiladas una vez por proceso (cada worker del modo paralelo tiene las suyas)
+_COMPILED_PRIORITY_RULES = [(re.compile(pattern, re.IGNORECASE), category)
+                            for pattern, category in PRIORITY_RULES]
+
 def categorize_product(name):
     """Categorize a product based on its name using priority rules first"""
     name_upper = name.upper()
     
     # PASO 1: Evaluar reglas de prioridad primero (patrones específicos)
-    for pattern, category in PRIORITY_RULES:
-        if re.search(pattern, name_upper, re.IGNORECASE):
+    for pattern, category in _COMPILED_PRIORITY_RULES:
+        if pattern.search(name_upper):
             return category
     
     # PASO 2: Buscar coincidencia por keywords
@@ -254,6 +264,279 @@ def categorize_product(name):
     
     return "otros"
 
+# Memo por proceso de categorize_product (workers del modo paralelo)
+_categorize_cached = lru_cache(maxsize=None)(categorize_product)
+
+# Confianza mínima para considerar un nombre truncado/ruidoso como un producto conocido
+MATCH_THRESHOLD = 0.6
+
+# Tokens de tamaño, formato o porcentaje ("1,5L", "500G", "6X1", "6X", "0%"):
+# dos nombres con tokens distintos nunca son el mismo producto
+SIZE_TOKEN_RE = re.compile(r'\d+(?:[,.]\d+)?\s*(?:(?:KG|ML|CL|L|G)(?![A-Z])|X\d*|%)')
+
+
+def normalize_product_name(name):
+    """Normalize a ticket product name for matching (uppercase, no accents/punctuation)"""
+    name = unicodedata.normalize('NFKD', name.upper())
+    name = ''.join(c for c in name if not unicodedata.combining(c))
+    name = re.sub(r'[^\w%+]+', ' ', name)
+    return re.sub(r'\s+', ' ', name).strip()
+
+
+def size_tokens(name):
+    """Set of size/pack/percentage tokens of a raw product name"""
+    return frozenset(re.sub(r'\s+', '', token).replace('.', ',')
+                     for token in SIZE_TOKEN_RE.findall(name.upper()))
+
+
+def _within_one_edit(a, b):
+    """True if a and b differ by at most one substitution, insertion or deletion"""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
+
+
+def _match_score(query_tokens, known_tokens):
+    """Asymmetric score of query as an abbreviated/noisy spelling of known, or 0.0.
+
+    Two shapes are accepted:
+
+    - abbreviation: every query token is a strict prefix of a known token, in
+      order (trailing or intermediate known tokens may be dropped), as in
+      ``Q SEMI`` -> ``QUESO SEMICURADO``. A query that spells a known token in
+      full (``TOMATE`` vs ``TOMATE FRITO``) is a different product.
+      Score: 0.5 + 0.5 * share of the known characters spelled out.
+    - OCR slip: same number of tokens, all equal except some of 4+ chars that
+      are one edit away. Only folds towards the spelling that sorts higher, so
+      digit-for-letter slips (``P0LLO``) fold into the lettered one and two
+      slips of each other never fold both ways.
+      Score: 0.5 + 0.5 * share of identical tokens.
+    """
+    if len(query_tokens) == len(known_tokens):
+        slips = 0
+        for query_token, known_token in zip(query_tokens, known_tokens):
+            if query_token == known_token:
+                continue
+            if len(query_token) < 4 or not _within_one_edit(query_token, known_token):
+                break
+            slips += 1
+        else:
+            if slips and ' '.join(query_tokens) < ' '.join(known_tokens):
+                return 0.5 + 0.5 * (len(query_tokens) - slips) / len(query_tokens)
+
+    pos = 0
+    for token in query_tokens:
+        while pos < len(known_tokens) and not (
+                len(known_tokens[pos]) > len(token) and known_tokens[pos].startswith(token)):
+            pos += 1
+        if pos == len(known_tokens):
+            return 0.0
+        pos += 1
+    query_chars = sum(len(t) for t in query_tokens)
+    known_chars = sum(len(t) for t in known_tokens)
+    return 0.5 + 0.5 * query_chars / known_chars
+
+
+class ProductIndex:
+    """Token-prefix inverted index resolving truncated/noisy names to a canonical product.
+
+    Every spelling is registered with add(); match() then resolves a name
+    against everything registered so far. A name folds into a known product
+    when it reads as an abbreviation or OCR slip of it (see _match_score)
+    with confidence >= ``threshold`` and, in addition:
+
+    - exactly one registered product qualifies (``GALL`` stays on its own
+      when both ``GALLETAS MARIA`` and ``GALLETAS DIGESTIVE`` are known),
+    - both names carry the same size/pack/percentage tokens,
+    - the rules put both names in the same category.
+
+    Folding follows chains to the final product, and spellings that normalize
+    alike (``ENS. MEZCLUM``/``ENS MEZCLUM``) share the lexicographically
+    smallest one as canonical name. Resolution only depends on the set of
+    registered names, not on the order they were added, so register every
+    name before resolving (build_product_history does two passes).
+
+    Categories are cached per raw spelling, so repeated names skip the rules
+    while every spelling keeps exactly the category the rules (and
+    js/parser.js) give it.
+    """
+
+    def __init__(self, threshold=MATCH_THRESHOLD):
+        self.threshold = threshold
+        self.names = []          # id -> canonical name
+        self._tokens = []        # id -> normalized tokens
+        self._sizes = []         # id -> size tokens
+        self._categories = []    # id -> category of the canonical name
+        self._exact = {}         # normalized name -> id
+        self._postings = {}      # first letter of a token -> list of ids
+        self._name_categories = {}  # raw name -> category
+        self._resolved = {}      # raw name -> (canonical name, confidence)
+
+    def _best(self, tokens, sizes, category, exclude=None):
+        """Return (id, confidence) of the single product tokens fold into, or (None, best_score)"""
+        if not tokens:
+            return None, 0.0
+
+        # Candidatos: la lista de postings más corta entre las iniciales de la consulta
+        candidates = min((self._postings.get(token[0], ()) for token in tokens), key=len)
+
+        best_id, best_score, qualifying = None, 0.0, 0
+        for pid in candidates:
+            if pid == exclude or self._sizes[pid] != sizes or self._categories[pid] != category:
+                continue
+            score = _match_score(tokens, self._tokens[pid])
+            if score >= self.threshold:
+                qualifying += 1
+            if score > best_score:
+                best_id, best_score = pid, score
+
+        # Ambiguo ("GALL" con varias galletas conocidas): mejor no agrupar
+        if qualifying != 1:
+            return None, best_score
+        return best_id, best_score
+
+    def match(self, name):
+        """Return (canonical_name, confidence) for name, or (None, best_score) if unknown"""
+        if name in self._resolved:
+            return self._resolved[name]
+
+        normalized = normalize_product_name(name)
+        pid, score = self._exact.get(normalized), 1.0
+        if pid is None:
+            category = self._name_categories.get(name) or _categorize_cached(name)
+            pid, score = self._best(normalized.split(), size_tokens(name), category)
+            if pid is None:
+                return None, score
+
+        # Seguir la cadena de agrupaciones hasta el producto final
+        seen = {pid}
+        while True:
+            target, hop_score = self._best(self._tokens[pid], self._sizes[pid],
+                                           self._categories[pid], exclude=pid)
+            if target is None or target in seen:
+                break
+            seen.add(target)
+            pid, score = target, min(score, hop_score)
+
+        self._resolved[name] = (self.names[pid], score)
+        return self.names[pid], score
+
+    def add(self, name, category=None):
+        """Register a spelling and return its rule category (computed if omitted)"""
+        # Nombres ya vistos: ni normalizar ni aplicar reglas otra vez
+        if name in self._name_categories:
+            return self._name_categories[name]
+
+        if category is None:
+            category = _categorize_cached(name)
+        self._name_categories[name] = category
+        # Un nombre nuevo puede cambiar cualquier resolución anterior
+        self._resolved.clear()
+
+        normalized = normalize_product_name(name)
+        pid = self._exact.get(normalized)
+        if pid is not None:
+            if name < self.names[pid]:
+                self.names[pid] = name
+                self._categories[pid] = category
+            return category
+
+        tokens = normalized.split()
+        pid = len(self.names)
+        self.names.append(name)
+        self._tokens.append(tokens)
+        self._sizes.append(size_tokens(name))
+        self._categories.append(category)
+        self._exact[normalized] = pid
+        for key in {token[0] for token in tokens}:
+            self._postings.setdefault(key, []).append(pid)
+        return category
+
+
+class PriceChangeDetector:
+    """Incremental per-product price change detector.
+
+    Fed one purchase at a time in date order, it records every unit price
+    change per product, the monthly average unit price of each product (what
+    the prices and insights tabs chart and compare) and a rolling
+    per-category inflation index.
+
+    The index is chained month over month (base 100 = first month of the
+    category): when a month closes, the index moves by the geometric mean of
+    price relatives (last price of the month / last price of the previous
+    month) of the products bought in both that month and the category's
+    previous month with purchases. Products not bought in both months do not
+    take part, so old or newly introduced products never dilute it. Each
+    purchase costs O(1) and closing a month costs O(products bought in it),
+    so the whole pass stays O(items).
+    """
+
+    def __init__(self):
+        self.events = {}          # product -> list of price change events
+        self.category_index = {}  # category -> {"YYYY-MM": index}
+        self._monthly = {}        # product -> {"YYYY-MM": [price sum, purchases]}
+        self._last = {}           # product -> last unit price
+        self._month = None        # month being accumulated ("YYYY-MM")
+        self._month_prices = {}   # category -> {product: last price this month}
+        self._prev_prices = {}    # category -> {product: last price in previous month}
+        self._level = {}          # category -> current index level
+
+    def update(self, name, category, date, price, store):
+        """Register a purchase of name at unit price on date (YYYY-MM-DD)"""
+        month = date[:7]
+        if month != self._month:
+            self._close_month()
+            self._month = month
+
+        last = self._last.get(name)
+        if last is not None and price != last:
+            self.events.setdefault(name, []).append({
+                "date": date,
+                "oldPrice": last,
+                "newPrice": price,
+                "changePct": round((price - last) / last * 100, 2) if last else None,
+                "store": store
+            })
+        self._last[name] = price
+
+        if price > 0:
+            self._month_prices.setdefault(category, {})[name] = price
+            totals = self._monthly.setdefault(name, {}).setdefault(month, [0.0, 0])
+            totals[0] += price
+            totals[1] += 1
+
+    def _close_month(self):
+        """Chain the index of every category with purchases in the current month"""
+        for category, prices in self._month_prices.items():
+            prev = self._prev_prices.get(category)
+            level = self._level.get(category, 100.0)
+            if prev:
+                logs = [math.log(price / prev[name]) for name, price in prices.items() if name in prev]
+                if logs:
+                    level *= math.exp(sum(logs) / len(logs))
+            self._level[category] = level
+            self.category_index.setdefault(category, {})[self._month] = round(level, 2)
+            self._prev_prices[category] = prices
+        self._month_prices = {}
+
+    def summary(self):
+        """Compact precomputed section for tickets.json"""
+        self._close_month()
+        return {
+            "events": self.events,
+            "monthly": {name: {month: round(total / count, 4) for month, (total, count) in months.items()}
+                        for name, months in self._monthly.items()},
+            "categoryIndex": self.category_index
+        }
+
+
 def parse_store_info(header_lines):
     """Extract store information from ticket header"""
     store = {"name": "Mercadona", "city": ""}
@@ -278,132 +561,230 @@ def parse_store_info(header_lines):
     
     return store
 
-def parse_tickets(text):
-    """Parse all tickets from the text file"""
-    tickets = []
-    seen_ids = set()
+def parse_ticket_block(block, seen_ids, index=None):
+    """Parse a single separator block into a ticket dict.
+
+    Returns None for headers, non-ticket blocks and invoices already in
+    seen_ids (which is updated with the new invoice id).
+    """
+    block = block.strip()
+    if not block:
+        return None
     
-    # Split by ticket separator
-    ticket_blocks = re.split(r'={10,}', text)
+    # Check if this is a ticket header (PDF filename)
+    if block.startswith('📄'):
+        return None
     
-    current_ticket = None
+    # Look for ticket data
+    lines = block.split('\n')
     
-    for block in ticket_blocks:
-        block = block.strip()
-        if not block:
-            continue
+    # Find date/time and invoice number
+    date_match = re.search(r'(\d{2}/\d{2}/\d{4})\s+(\d{2}:\d{2})', block)
+    invoice_match = re.search(r'FACTURA SIMPLIFICADA:\s*(\S+)', block)
+    total_match = re.search(r'TOTAL \(€\)\s*([\d,]+)', block)
+    
+    if not (date_match and invoice_match and total_match):
+        return None
+    
+    # Parse date
+    date_str = date_match.group(1)
+    time_str = date_match.group(2)
+    date_obj = datetime.strptime(date_str, "%d/%m/%Y")
+    
+    invoice_id = invoice_match.group(1)
+    
+    # Skip duplicates
+    if invoice_id in seen_ids:
+        return None
+    seen_ids.add(invoice_id)
+    
+    total_str = total_match.group(1).replace(',', '.')
+    total = float(total_str)
+    
+    # Get store info
+    store = parse_store_info(lines[:10])
+    
+    # Parse items
+    items = []
+    in_items = False
+    
+    for line in lines:
+        line = line.strip()
         
-        # Check if this is a ticket header (PDF filename)
-        if block.startswith('📄'):
+        if 'Descripción' in line and 'Importe' in line:
+            in_items = True
             continue
         
-        # Look for ticket data
-        lines = block.split('\n')
-        
-        # Find date/time and invoice number
-        date_match = re.search(r'(\d{2}/\d{2}/\d{4})\s+(\d{2}:\d{2})', block)
-        invoice_match = re.search(r'FACTURA SIMPLIFICADA:\s*(\S+)', block)
-        total_match = re.search(r'TOTAL \(€\)\s*([\d,]+)', block)
-        
-        if date_match and invoice_match and total_match:
-            # Parse date
-            date_str = date_match.group(1)
-            time_str = date_match.group(2)
-            date_obj = datetime.strptime(date_str, "%d/%m/%Y")
+        if in_items:
+            # Stop at TOTAL line
+            if line.startswith('TOTAL (€)'):
+                break
             
-            invoice_id = invoice_match.group(1)
+            # Parse item line: "1 PRODUCT NAME 1,25" or "2 PRODUCT NAME 1,25 2,50"
+            # Also handle weighted items like "1,440 kg 2,10 €/kg 3,02"
             
-            # Skip duplicates
-            if invoice_id in seen_ids:
+            # Check for weighted item continuation
+            weight_match = re.match(r'([\d,]+)\s*kg\s*([\d,]+)\s*€/kg\s*([\d,]+)', line)
+            if weight_match and items:
+                # Update the last item with weight info
+                weight = float(weight_match.group(1).replace(',', '.'))
+                price_per_kg = float(weight_match.group(2).replace(',', '.'))
+                final_price = float(weight_match.group(3).replace(',', '.'))
+                items[-1]['price'] = final_price
+                items[-1]['weight'] = weight
                 continue
-            seen_ids.add(invoice_id)
-            
-            total_str = total_match.group(1).replace(',', '.')
-            total = float(total_str)
-            
-            # Get store info
-            store = parse_store_info(lines[:10])
             
-            # Parse items
-            items = []
-            in_items = False
-            
-            for line in lines:
-                line = line.strip()
+            # Regular item line
+            item_match = re.match(r'^(\d+)\s+(.+?)\s+([\d,]+)(?:\s+([\d,]+))?$', line)
+            if item_match:
+                qty = int(item_match.group(1))
+                name = item_match.group(2).strip()
                 
-                if 'Descripción' in line and 'Importe' in line:
-                    in_items = True
-                    continue
+                # If there's a 4th group, that's the total (qty > 1)
+                if item_match.group(4):
+                    unit_price = float(item_match.group(3).replace(',', '.'))
+                    total_price = float(item_match.group(4).replace(',', '.'))
+                else:
+                    total_price = float(item_match.group(3).replace(',', '.'))
+                    unit_price = total_price / qty if qty > 0 else total_price
                 
-                if in_items:
-                    # Stop at TOTAL line
-                    if line.startswith('TOTAL (€)'):
-                        break
-                    
-                    # Parse item line: "1 PRODUCT NAME 1,25" or "2 PRODUCT NAME 1,25 2,50"
-                    # Also handle weighted items like "1,440 kg 2,10 €/kg 3,02"
-                    
-                    # Check for weighted item continuation
-                    weight_match = re.match(r'([\d,]+)\s*kg\s*([\d,]+)\s*€/kg\s*([\d,]+)', line)
-                    if weight_match and items:
-                        # Update the last item with weight info
-                        weight = float(weight_match.group(1).replace(',', '.'))
-                        price_per_kg = float(weight_match.group(2).replace(',', '.'))
-                        final_price = float(weight_match.group(3).replace(',', '.'))
-                        items[-1]['price'] = final_price
-                        items[-1]['weight'] = weight
-                        continue
-                    
-                    # Regular item line
-                    item_match = re.match(r'^(\d+)\s+(.+?)\s+([\d,]+)(?:\s+([\d,]+))?$', line)
-                    if item_match:
-                        qty = int(item_match.group(1))
-                        name = item_match.group(2).strip()
-                        
-                        # If there's a 4th group, that's the total (qty > 1)
-                        if item_match.group(4):
-                            unit_price = float(item_match.group(3).replace(',', '.'))
-                            total_price = float(item_match.group(4).replace(',', '.'))
-                        else:
-                            total_price = float(item_match.group(3).replace(',', '.'))
-                            unit_price = total_price / qty if qty > 0 else total_price
-                        
-                        # Clean up name
-                        name = re.sub(r'\s+', ' ', name).strip()
-                        
-                        # Skip non-product lines
-                        if name and not any(skip in name.upper() for skip in ['TARJETA', 'IVA', 'BASE', 'CUOTA', 'ENTREGA', 'PARKING']):
-                            items.append({
-                                "name": name,
-                                "price": round(total_price, 2),
-                                "quantity": qty,
-                                "unitPrice": round(unit_price, 2),
-                                "category": categorize_product(name)
-                            })
-            
-            ticket = {
-                "id": invoice_id,
-                "date": date_obj.strftime("%Y-%m-%d"),
-                "time": time_str,
-                "total": total,
-                "store": store,
-                "items": items
-            }
-            
+                # Clean up name
+                name = re.sub(r'\s+', ' ', name).strip()
+                
+                # Skip non-product lines
+                if name and not any(skip in name.upper() for skip in ['TARJETA', 'IVA', 'BASE', 'CUOTA', 'ENTREGA', 'PARKING']):
+                    if index is not None:
+                        category = index.add(name)
+                    else:
+                        category = _categorize_cached(name)
+                    items.append({
+                        "name": name,
+                        "price": round(total_price, 2),
+                        "quantity": qty,
+                        "unitPrice": round(unit_price, 2),
+                        "category": category
+                    })
+    
+    ticket = {
+        "id": invoice_id,
+        "date": date_obj.strftime("%Y-%m-%d"),
+        "time": time_str,
+        "total": total,
+        "store": store,
+        "items": items
+    }
+    
+    return ticket
+
+def available_cpus():
+    """CPUs this process may run on (honours CPU affinity where the OS exposes it)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _parse_chunk(blocks):
+    """Worker entry point: parse a contiguous run of blocks (first occurrence wins)"""
+    seen_ids = set()
+    tickets = []
+    for block in blocks:
+        ticket = parse_ticket_block(block, seen_ids)
+        if ticket is not None:
             tickets.append(ticket)
+    return tickets
+
+def parse_tickets(text, index=None, workers=1):
+    """Parse all tickets from the text file.
+
+    If a ProductIndex is given, every item name is registered in it and
+    repeated spellings reuse their cached categorization.
+
+    With workers > 1 (capped at the CPU count) the blocks are sharded into
+    contiguous chunks parsed in separate processes; chunks are merged in
+    order with first-occurrence-wins dedup, so the result is identical to
+    the serial path.
+    """
+    tickets = []
+    seen_ids = set()
+    
+    # Split by ticket separator
+    ticket_blocks = re.split(r'={10,}', text)
+    
+    # Más procesos que CPUs solo añade coste de arranque y de serialización
+    workers = min(workers, available_cpus())
+    if workers > 1 and len(ticket_blocks) > 1:
+        chunk_size = -(-len(ticket_blocks) // (workers * 4))
+        chunks = [ticket_blocks[i:i + chunk_size] for i in range(0, len(ticket_blocks), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_tickets in executor.map(_parse_chunk, chunks):
+                for ticket in chunk_tickets:
+                    if ticket['id'] in seen_ids:
+                        continue
+                    seen_ids.add(ticket['id'])
+                    tickets.append(ticket)
+        
+        # Registrar en el índice del proceso padre los nombres parseados por los workers
+        if index is not None:
+            for ticket in tickets:
+                for item in ticket['items']:
+                    index.add(item['name'], item['category'])
+    else:
+        for block in ticket_blocks:
+            ticket = parse_ticket_block(block, seen_ids, index)
+            if ticket is not None:
+                tickets.append(ticket)
     
     # Sort by date
     tickets.sort(key=lambda x: x['date'])
     
     return tickets
 
+def build_product_history(tickets, index):
+    """Group purchases by canonical product and run the price change detector.
+
+    tickets must be sorted by date. Every name is registered before any is
+    resolved, so the grouping does not depend on the order of the tickets.
+    Returns (product_history, product_aliases, detector).
+    """
+    for ticket in tickets:
+        for item in ticket['items']:
+            index.add(item['name'], item['category'])
+    
+    product_history = {}
+    product_aliases = {}
+    detector = PriceChangeDetector()
+    canonical_categories = {}
+    for ticket in tickets:
+        for item in ticket['items']:
+            name, confidence = index.match(item['name'])
+            # Una sola categoría por producto: la de su primera aparición
+            category = canonical_categories.setdefault(name, item['category'])
+            if name != item['name']:
+                product_aliases[item['name']] = {"canonical": name, "confidence": round(confidence, 2)}
+            if name not in product_history:
+                product_history[name] = []
+            price = item.get('unitPrice', item['price'])
+            product_history[name].append({
+                "date": ticket['date'],
+                "price": price,
+                "store": ticket['store']['city']
+            })
+            detector.update(name, category, ticket['date'], price, ticket['store']['city'])
+    
+    return product_history, product_aliases, detector
+
 def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip())
+    arg_parser.add_argument('-j', '--workers', type=int, default=1,
+                            help='Number of worker processes used to parse ticket blocks (default: 1)')
+    args = arg_parser.parse_args()
+    
     # Read the source file
     with open('tickets_mercadona.txt', 'r', encoding='utf-8') as f:
         text = f.read()
     
     # Parse tickets
-    tickets = parse_tickets(text)
+    index = ProductIndex()
+    tickets = parse_tickets(text, index, workers=args.workers)
     
     print(f"Parsed {len(tickets)} unique tickets")
     
@@ -428,20 +809,15 @@ def main():
         "productHistory": {}
     }
     
-    # Build product history
-    product_history = {}
-    for ticket in tickets:
-        for item in ticket['items']:
-            name = item['name']
-            if name not in product_history:
-                product_history[name] = []
-            product_history[name].append({
-                "date": ticket['date'],
-                "price": item.get('unitPrice', item['price']),
-                "store": ticket['store']['city']
-            })
+    # Build product history (variantes del mismo producto agrupadas bajo su nombre canónico)
+    product_history, product_aliases, detector = build_product_history(tickets, index)
     
     data['productHistory'] = product_history
+    data['productAliases'] = product_aliases
+    data['priceChanges'] = {"ticketCount": len(tickets), **detector.summary()}
+    
+    change_count = sum(len(events) for events in detector.events.values())
+    print(f"Price changes detected: {change_count} in {len(detector.events)} products")
     
     # Write to JSON
     with open('data/tickets.json', 'w', encoding='utf-8') as f:
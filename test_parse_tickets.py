@@ -0,0 +1,193 @@
+import json
+from itertools import permutations
+
+import parse_tickets
+from bench_parse_tickets import generate_corpus
+from parse_tickets import (PriceChangeDetector, ProductIndex, build_product_history,
+                           categorize_product, size_tokens)
+
+
+def make_index(*names):
+    index = ProductIndex()
+    for name in names:
+        index.add(name)
+    return index
+
+
+def test_truncated_names_resolve_to_known_product():
+    index = make_index("GALLETAS MARIA", "QUESO SEMICURADO")
+
+    for short, full in [("GALL", "GALLETAS MARIA"), ("Q SEMI", "QUESO SEMICURADO")]:
+        canonical, confidence = index.match(short)
+        assert canonical == full
+        assert index.threshold <= confidence < 1.0
+
+
+def test_ocr_slip_resolves_to_known_product():
+    index = make_index("PECHUGA POLLO", "PECHUGA P0LLO")
+
+    assert index.match("PECHUGA P0LLO")[0] == "PECHUGA POLLO"
+    assert index.match("PECHUGA POLLO") == ("PECHUGA POLLO", 1.0)
+
+
+def test_ambiguous_truncation_is_not_merged():
+    index = make_index("GALLETAS MARIA", "GALLETAS DIGESTIVE")
+
+    assert index.match("GALL")[0] is None
+
+
+def test_resolution_does_not_depend_on_registration_order():
+    for names in permutations(["GALL", "GALLETAS MARIA", "GALLETAS DIGESTIVE"]):
+        index = make_index(*names)
+        assert index.match("GALL") == ("GALL", 1.0)
+        assert index.match("GALLETAS MARIA") == ("GALLETAS MARIA", 1.0)
+
+    for names in permutations(["GALL", "GALLETAS MARIA"]):
+        index = make_index(*names)
+        assert index.match("GALL")[0] == "GALLETAS MARIA"
+        assert index.match("GALLETAS MARIA") == ("GALLETAS MARIA", 1.0)
+
+
+def test_name_spelled_in_full_does_not_fold_into_longer_product():
+    for short, full in [("TOMATE", "TOMATE FRITO"),
+                        ("PAN", "PAN RALLADO"),
+                        ("PAN BARRA", "PANECILLO BARRA"),
+                        ("ACEITE", "ACEITE OLIVA"),
+                        ("LECHE", "LECHE ENTERA"),
+                        ("LECHE SEMI", "LECHE ENTERA")]:
+        index = make_index(full, short)
+        assert index.match(short) == (short, 1.0)
+        assert index.match(full) == (full, 1.0)
+
+
+def test_names_with_different_categories_are_not_merged():
+    # Las reglas ponen "MEJIL." en despensa y "MEJILLONES ..." en proteinas
+    assert categorize_product("MEJIL.") != categorize_product("MEJILLONES ESCABECHE")
+    index = make_index("MEJILLONES ESCABECHE", "MEJIL.")
+
+    assert index.match("MEJIL.") == ("MEJIL.", 1.0)
+
+
+def test_size_pack_and_percentage_variants_are_not_merged():
+    for first, second in [("LECHE ENTERA", "LECHE ENTERA 6X1L"),
+                          ("AGUA MINERAL 5L", "AGUA MINERAL 1,5L"),
+                          ("CHOCOLATE NEGRO 99%", "CHOCOLATE NEGRO 72%"),
+                          ("YOGUR NATURAL", "YOGUR NATURAL 0%"),
+                          ("CERV. SIN", "CERV. SIN 6X")]:
+        index = make_index(first, second)
+        assert index.match(first) == (first, 1.0)
+        assert index.match(second) == (second, 1.0)
+
+
+def test_size_tokens():
+    assert size_tokens("AGUA MINERAL 1,5L") == {"1,5L"}
+    assert size_tokens("LECHE ENTERA 6X1L") == {"6X1"}
+    assert size_tokens("CERV. SIN 6X") == {"6X"}
+    assert size_tokens("GALLETAS 2 GUSTOS") == set()
+
+
+def test_category_follows_rules_of_each_spelling():
+    index = ProductIndex()
+
+    assert index.add("ENS MEZCLUM") == categorize_product("ENS MEZCLUM")
+    assert index.add("ENS. MEZCLUM") == categorize_product("ENS. MEZCLUM")
+    assert index.match("ENS. MEZCLUM") == ("ENS MEZCLUM", 1.0)
+
+
+def make_ticket(date, *items):
+    return {
+        "date": date,
+        "store": {"name": "Mercadona Galapagar", "city": "GALAPAGAR"},
+        "items": [{"name": name, "price": price, "quantity": 1, "unitPrice": price,
+                   "category": categorize_product(name)} for name, price in items]
+    }
+
+
+def test_price_change_detected_and_pack_variant_ignored():
+    tickets = [
+        make_ticket("2024-01-10", ("LECHE ENTERA", 0.95), ("AGUA MINERAL 5L", 1.0)),
+        make_ticket("2024-02-10", ("LECHE ENTERA 6X1L", 5.70), ("AGUA MINERAL 1,5L", 0.35)),
+        make_ticket("2024-03-10", ("LECHE ENTERA", 0.99), ("AGUA MINERAL 5L", 1.0)),
+    ]
+
+    history, aliases, detector = build_product_history(tickets, ProductIndex())
+    changes = detector.summary()
+
+    assert aliases == {}
+    assert set(history) == {"LECHE ENTERA", "LECHE ENTERA 6X1L", "AGUA MINERAL 5L", "AGUA MINERAL 1,5L"}
+    assert changes["events"] == {"LECHE ENTERA": [{
+        "date": "2024-03-10", "oldPrice": 0.95, "newPrice": 0.99,
+        "changePct": 4.21, "store": "GALAPAGAR"}]}
+
+
+def test_unabbreviated_prefix_name_produces_no_price_event():
+    tickets = [
+        make_ticket("2024-01-10", ("TOMATE FRITO", 0.85)),
+        make_ticket("2024-02-10", ("TOMATE", 2.10)),
+    ]
+
+    history, aliases, detector = build_product_history(tickets, ProductIndex())
+
+    assert aliases == {}
+    assert set(history) == {"TOMATE FRITO", "TOMATE"}
+    assert detector.summary()["events"] == {}
+
+
+def test_category_index_chains_products_bought_in_both_months():
+    detector = PriceChangeDetector()
+    detector.update("LECHE", "lacteos", "2024-01-02", 1.0, "GALAPAGAR")
+    detector.update("QUESO", "lacteos", "2024-01-05", 2.0, "GALAPAGAR")
+    detector.update("LECHE", "lacteos", "2024-02-02", 1.1, "GALAPAGAR")
+    # Producto nuevo en febrero: no entra en el índice hasta tener dos meses
+    detector.update("YOGUR", "lacteos", "2024-02-03", 9.0, "GALAPAGAR")
+    detector.update("LECHE", "lacteos", "2024-03-02", 1.1, "GALAPAGAR")
+    detector.update("YOGUR", "lacteos", "2024-03-03", 9.9, "GALAPAGAR")
+
+    index = detector.summary()["categoryIndex"]["lacteos"]
+    assert index["2024-01"] == 100.0
+    assert index["2024-02"] == 110.0
+    # Jevons de marzo: sqrt(1.0 * 1.1) sobre 110
+    assert index["2024-03"] == round(110 * 1.1 ** 0.5, 2)
+
+
+def test_canonical_product_feeds_a_single_category_index():
+    # "ENS. MEZCLUM" cae en otros por reglas, pero es el mismo producto que "ENS MEZCLUM"
+    tickets = [
+        make_ticket("2024-01-10", ("ENS MEZCLUM", 1.0)),
+        make_ticket("2024-02-10", ("ENS. MEZCLUM", 1.1)),
+    ]
+
+    _, aliases, detector = build_product_history(tickets, ProductIndex())
+    category_index = detector.summary()["categoryIndex"]
+
+    assert aliases == {"ENS. MEZCLUM": {"canonical": "ENS MEZCLUM", "confidence": 1.0}}
+    assert category_index == {categorize_product("ENS MEZCLUM"): {"2024-01": 100.0, "2024-02": 110.0}}
+
+
+def test_monthly_average_unit_prices():
+    detector = PriceChangeDetector()
+    detector.update("LECHE", "lacteos", "2024-01-02", 1.0, "GALAPAGAR")
+    detector.update("LECHE", "lacteos", "2024-01-20", 1.2, "GALAPAGAR")
+    detector.update("LECHE", "lacteos", "2024-02-02", 1.3, "GALAPAGAR")
+
+    assert detector.summary()["monthly"] == {"LECHE": {"2024-01": 1.1, "2024-02": 1.3}}
+
+
+def test_parallel_parse_matches_serial(monkeypatch):
+    # El entorno de CI puede tener una sola CPU: forzar el modo paralelo
+    monkeypatch.setattr(parse_tickets, "available_cpus", lambda: 4)
+    text = generate_corpus(400, duplicate_ratio=0.2)
+
+    serial_index, parallel_index = ProductIndex(), ProductIndex()
+    serial = parse_tickets.parse_tickets(text, serial_index)
+    parallel = parse_tickets.parse_tickets(text, parallel_index, workers=4)
+
+    # Hay facturas duplicadas en chunks distintos: gana la primera aparición
+    assert len(serial) < 400
+    assert json.dumps(parallel, ensure_ascii=False) == json.dumps(serial, ensure_ascii=False)
+    assert parse_tickets.parse_tickets(text, workers=4) == serial
+
+    serial_history = build_product_history(serial, serial_index)
+    parallel_history = build_product_history(parallel, parallel_index)
+    assert serial_history[:2] == parallel_history[:2]
+    assert serial_history[2].summary() == parallel_history[2].summary()